@@ -1,5 +1,6 @@
 from collections.abc import Iterable, Iterator, Mapping
-from functools import reduce
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Callable, TypeVar
 
 T = TypeVar("T")
@@ -27,15 +28,33 @@ def fzip(
     if identity:
         fns = (lambda x: x,) + fns
 
-    # iterate and apply
-    for e in seq:
-        yield tuple(fn(e) for fn in fns)
+    # iterate and apply (unrolled for small numbers of functions)
+    match len(fns):
+        case 1:
+            f0 = fns[0]
+            for e in seq:
+                yield (f0(e),)
+        case 2:
+            f0, f1 = fns
+            for e in seq:
+                yield (f0(e), f1(e))
+        case 3:
+            f0, f1, f2 = fns
+            for e in seq:
+                yield (f0(e), f1(e), f2(e))
+        case 4:
+            f0, f1, f2, f3 = fns
+            for e in seq:
+                yield (f0(e), f1(e), f2(e), f3(e))
+        case _:
+            for e in seq:
+                yield tuple([fn(e) for fn in fns])
 
 
 def unique(seq: Iterable[T], ids: bool = True) -> Iterator[T]:
     r"""Filters non-unique elements in an iterable.
 
-    Underneath this uses a hash set for testing equality. By default, the memory
+    Underneath this uses a hash table for testing equality. By default, the memory
     location of objects, ``id(obj)`` is used and therefore tests by identity. When
     ``ids`` is set to ``False``, this acts like a lazily evaluated ``set()`` call.
 
@@ -47,14 +66,24 @@ def unique(seq: Iterable[T], ids: bool = True) -> Iterator[T]:
     Yields:
         T: unique elements in the iterable.
     """
-    # set of found elements
-    found = set()
-
-    # filter by hash equality (using integer id as key if ids)
-    for elem, key in fzip(seq, (lambda e: id(e)) if ids else (lambda e: e)):
-        if key not in found:
-            found.add(key)
-            yield elem
+    # found elements, insertion grows the dict only for unseen keys
+    found = {}
+
+    # filter by identity
+    if ids:
+        for elem in seq:
+            size = len(found)
+            found[id(elem)] = None
+            if len(found) != size:
+                yield elem
+
+    # filter by hash equality
+    else:
+        for elem in seq:
+            size = len(found)
+            found[elem] = None
+            if len(found) != size:
+                yield elem
 
 
 class Proxy:
@@ -90,13 +119,20 @@ class Proxy:
         self.inner = inner
         self.firstacc = firstacc
         self.otheracc = otheracc
+        self._firstparts = _split_attr(firstacc) if firstacc else ()
+        self._paths: dict[str, tuple[str, ...]] = {}
 
     def __getattr__(self, attr: str) -> Any:
+        # resolve the full accessor path for the attribute
+        path = self._paths.get(attr)
+        if path is None:
+            path = _split_attr(attr) + self._firstparts
+            self._paths[attr] = path
+
         # first proxy step
-        if self.firstacc:
-            res = rgetattr(self.inner, attr + "." + self.firstacc)
-        else:
-            res = rgetattr(self.inner, attr)
+        res = self.inner
+        for name in path:
+            res = getattr(res, name)
 
         # optionally chain proxies
         if self.otheracc:
@@ -138,6 +174,24 @@ class MapAccessor(Mapping):
             raise AttributeError(f"attribute ('{attr}') does not exist")
 
 
+@lru_cache(maxsize=1024)
+def _split_attr(attr: str) -> tuple[str, ...]:
+    r"""Splits a dot-notation attribute string into its components (cached)."""
+    return tuple(attr.split("."))
+
+
+@lru_cache(maxsize=4096)
+def _attrgetter(attr: str) -> attrgetter:
+    r"""Creates a getter for a dot-notation attribute string (cached)."""
+    return attrgetter(attr)
+
+
+@lru_cache(maxsize=1024)
+def _rpartition_attr(attr: str) -> tuple[str, str, str]:
+    r"""Partitions a dot-notation attribute string at its last dot (cached)."""
+    return attr.rpartition(".")
+
+
 def rgetattr(obj: object, attr: str, *default) -> Any:
     r"""Accesses and returns an object attribute recursively using dot notation.
 
@@ -163,7 +217,7 @@ def rgetattr(obj: object, attr: str, *default) -> Any:
     """
 
     try:
-        return reduce(getattr, [obj] + attr.split("."))
+        return _attrgetter(attr)(obj)
 
     except AttributeError:
         if default:
@@ -186,7 +240,7 @@ def rsetattr(obj: object, attr: str, val: Any) -> None:
             excluding the initial dot.
         val (Any): value to which the attribute will be set.
     """
-    pre, _, post = attr.rpartition(".")
+    pre, _, post = _rpartition_attr(attr)
     setattr(rgetattr(obj, pre) if pre else obj, post, val)
 
 
@@ -1,14 +1,10 @@
 import cmath
 import einops as ein
-import functools
 import math
 import numpy as np
 import torch
-import torch.nn as nn
-import torch.nn.functional as F
 
 
-@functools.singledispatch
 def exp(
     x: int | float | complex | torch.Tensor | np.ndarray | np.number,
 ) -> float | complex | torch.Tensor | np.ndarray | np.number:
@@ -25,36 +21,18 @@ def exp(
         float | complex | torch.Tensor | numpy.ndarray | numpy.number: :math:`e`
         raised to the input.
     """
-    raise NotImplementedError
-
-
-@exp.register(int)
-@exp.register(float)
-def _(x: int | float) -> float:
-    return math.exp(x)
-
-
-@exp.register(complex)
-def _(x: complex) -> complex:
-    return cmath.exp(x)
-
-
-@exp.register(torch.Tensor)
-def _(x: torch.Tensor) -> torch.Tensor:
-    return torch.exp(x)
-
-
-@exp.register(np.ndarray)
-def _(x: np.ndarray) -> np.ndarray:
-    return np.exp(x)
-
-
-@exp.register(np.number)
-def _(x: np.number) -> np.number:
-    return np.exp(x)
+    if isinstance(x, torch.Tensor):
+        return torch.exp(x)
+    elif isinstance(x, np.ndarray | np.number):
+        return np.exp(x)
+    elif isinstance(x, int | float):
+        return math.exp(x)
+    elif isinstance(x, complex):
+        return cmath.exp(x)
+    else:
+        raise NotImplementedError
 
 
-@functools.singledispatch
 def sqrt(
     x: int | float | complex | torch.Tensor | np.ndarray | np.number,
 ) -> float | complex | torch.Tensor | np.ndarray | np.number:
@@ -71,33 +49,16 @@ def sqrt(
         float | complex | torch.Tensor | numpy.ndarray | numpy.number: square root of
         the input.
     """
-    raise NotImplementedError
-
-
-@sqrt.register(int)
-@sqrt.register(float)
-def _(x: int | float) -> float:
-    return math.sqrt(x)
-
-
-@sqrt.register(complex)
-def _(x: complex) -> complex:
-    return cmath.sqrt(x)
-
-
-@sqrt.register(torch.Tensor)
-def _(x: torch.Tensor) -> torch.Tensor:
-    return torch.sqrt(x)
-
-
-@sqrt.register(np.ndarray)
-def _(x: np.ndarray) -> np.ndarray:
-    return np.sqrt(x)
-
-
-@sqrt.register(np.number)
-def _(x: np.number) -> np.number:
-    return np.sqrt(x)
+    if isinstance(x, torch.Tensor):
+        return torch.sqrt(x)
+    elif isinstance(x, np.ndarray | np.number):
+        return np.sqrt(x)
+    elif isinstance(x, int | float):
+        return math.sqrt(x)
+    elif isinstance(x, complex):
+        return cmath.sqrt(x)
+    else:
+        raise NotImplementedError
 
 
 def normalize(
@@ -122,7 +83,17 @@ def normalize(
     Returns:
         torch.Tensor: normalized tensor.
     """
-    return scale * F.normalize(data, p=order, dim=dim, eps=epsilon)  # type: ignore
+    # normalize to unit norm
+    norm = torch.linalg.vector_norm(data, ord=order, dim=dim, keepdim=True)
+    res = data / norm.clamp_min(epsilon)
+
+    # scale in-place on the fresh result where possible
+    if scale == 1.0:
+        return res
+    elif isinstance(scale, complex) and not res.is_complex():
+        return scale * res
+    else:
+        return res.mul_(scale)
 
 
 def rescale(
@@ -162,8 +133,18 @@ def rescale(
     if resmax is None:
         resmax = srcmax
 
-    # rescale and return
-    return resmin + (((data - srcmin) * (resmax - resmin)) / (srcmax - srcmin))
+    # bring bounds to tensors in the promoted type of the data
+    dtype = data.dtype if data.is_floating_point() else torch.result_type(data, 1.0)
+    srcmin, srcmax, resmin, resmax = (
+        torch.as_tensor(v, dtype=dtype, device=data.device)
+        for v in (srcmin, srcmax, resmin, resmax)
+    )
+
+    # precompute scale, shifting before scaling keeps the bounds exact
+    scale = (resmax - resmin) / (srcmax - srcmin)
+
+    # rescale with a fused multiply-add and return
+    return torch.addcmul(resmin, data - srcmin, scale)
 
 
 def exponential_smoothing(
@@ -195,7 +176,16 @@ def exponential_smoothing(
     if level is None:
         return obs
 
-    # standard condition
+    # standard condition (fused linear interpolation for real floating inputs)
+    elif (
+        obs.is_floating_point()
+        and level.dtype == obs.dtype
+        and not isinstance(alpha, complex)
+        and (not isinstance(alpha, torch.Tensor) or alpha.dtype == obs.dtype)
+    ):
+        return torch.lerp(level, obs, alpha)
+
+    # fallback condition
     else:
         return alpha * obs + (1 - alpha) * level
 
@@ -296,25 +286,32 @@ def isi(
     # ensure step time is a float
     step_time = float(step_time)
 
-    # pad spikes with true to ensure at least one (req. for split)
-    padded = F.pad(spikes, (1, 0), mode="constant", value=True)
-
-    # compute nonzero values
-    nz = torch.nonzero(padded)[..., -1]
+    # flatten to (batch, time) and count spikes per train
+    flat = spikes.reshape(math.prod(spikes.shape[:-1]), spikes.shape[-1]).bool()
+    counts = torch.sum(flat, dim=-1)
+    maxcount = int(torch.amax(counts)) if counts.numel() else 0
 
-    # compute split indices (at the added pads)
-    splits = torch.nonzero(torch.logical_not(nz)).view(-1).tolist()[1:]
+    # skip computation if no train has an interval
+    if maxcount < 2:
+        intervals = torch.empty(
+            flat.shape[0], 0, dtype=torch.get_default_dtype(), device=flat.device
+        )
 
-    # split the tensor into various length subtensors (subtract 1 to unshift)
-    intervals = torch.tensor_split((nz - 1) * step_time, splits, dim=-1)
-
-    # stack, pad trailing with nan, trim leading pad
-    intervals = nn.utils.rnn.pad_sequence(
-        intervals, batch_first=True, padding_value=float("nan")
-    )[:, 1:]
-
-    # compute intervals
-    intervals = torch.diff(intervals, dim=-1)
+    else:
+        # stable sort moves spike indices to the front, in temporal order
+        times = torch.argsort(
+            flat.to(torch.int8), dim=-1, descending=True, stable=True
+        )
+        times = times[:, :maxcount] * step_time
+
+        # pad trailing with nan where a train has fewer spikes
+        times = times.masked_fill(
+            torch.arange(maxcount, device=flat.device) >= counts.unsqueeze(-1),
+            float("nan"),
+        )
+
+        # compute intervals
+        intervals = torch.diff(times, dim=-1)
 
     # reshape and return
     if time_first:
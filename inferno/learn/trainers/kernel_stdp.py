@@ -113,14 +113,14 @@ class KernelSTDP(IndependentCellTrainer):
         kernel_post_kwargs = kwargs.get(
             "kernel_post_kwargs",
             {
-                k: v.clone().detach() if isinstance(v, torch.Tensor) else v
+                k: v.detach().clone() if isinstance(v, torch.Tensor) else v
                 for k, v in self.kernel_post_kwargs.items()
             },
         )
         kernel_pre_kwargs = kwargs.get(
             "kernel_pre_kwargs",
             {
-                k: v.clone().detach() if isinstance(v, torch.Tensor) else v
+                k: v.detach().clone() if isinstance(v, torch.Tensor) else v
                 for k, v in self.kernel_pre_kwargs.items()
             },
         )
@@ -399,14 +399,14 @@ class DelayAdjustedKernelSTDP(IndependentCellTrainer):
         kernel_post_kwargs = kwargs.get(
             "kernel_post_kwargs",
             {
-                k: v.clone().detach() if isinstance(v, torch.Tensor) else v
+                k: v.detach().clone() if isinstance(v, torch.Tensor) else v
                 for k, v in self.kernel_post_kwargs.items()
             },
         )
         kernel_pre_kwargs = kwargs.get(
             "kernel_pre_kwargs",
             {
-                k: v.clone().detach() if isinstance(v, torch.Tensor) else v
+                k: v.detach().clone() if isinstance(v, torch.Tensor) else v
                 for k, v in self.kernel_pre_kwargs.items()
             },
         )
@@ -667,14 +667,14 @@ class DelayAdjustedKernelSTDPD(IndependentCellTrainer):
         kernel_post_kwargs = kwargs.get(
             "kernel_post_kwargs",
             {
-                k: v.clone().detach() if isinstance(v, torch.Tensor) else v
+                k: v.detach().clone() if isinstance(v, torch.Tensor) else v
                 for k, v in self.kernel_post_kwargs.items()
             },
         )
         kernel_pre_kwargs = kwargs.get(
             "kernel_pre_kwargs",
             {
-                k: v.clone().detach() if isinstance(v, torch.Tensor) else v
+                k: v.detach().clone() if isinstance(v, torch.Tensor) else v
                 for k, v in self.kernel_pre_kwargs.items()
             },
         )
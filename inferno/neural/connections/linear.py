@@ -8,6 +8,43 @@ import torch
 import torch.nn.functional as F
 
 
+def _shape_arg(name: str, value: tuple[int, ...] | int) -> tuple[int, ...]:
+    r"""Internal, validates a shape given as an integer or a sequence thereof.
+
+    Args:
+        name (str): display name of the argument.
+        value (tuple[int, ...] | int): shape to validate.
+
+    Returns:
+        tuple[int, ...]: validated shape.
+    """
+    if isinstance(value, int):
+        return (argtest.gt(name, value, 0, int),)
+
+    try:
+        return argtest.ofsequence(name, value, argtest.gt, 0, int)
+    except TypeError:
+        return (argtest.gt(name, value, 0, int),)
+
+
+def _offdiagonal(value: torch.Tensor, size: int) -> torch.Tensor:
+    r"""Internal, broadcasts to a square matrix with a zeroed diagonal.
+
+    Args:
+        value (torch.Tensor): tensor broadcastable to a square matrix.
+        size (int): number of rows and columns of the matrix.
+
+    Returns:
+        torch.Tensor: new floating point matrix with a zero diagonal.
+    """
+    return (
+        value.expand(size, size)
+        .to(torch.result_type(value, 1.0))
+        .clone()
+        .fill_diagonal_(0)
+    )
+
+
 class LinearDense(WeightBiasDelayMixin, Connection):
     r"""Linear all-to-all connection.
 
@@ -62,6 +99,9 @@ class LinearDense(WeightBiasDelayMixin, Connection):
 
         If ``delay_init`` is None, ``delay`` is initialized as zeros using
         :py:func:`torch.rand`.
+
+        When an initializer is given, it is passed an uninitialized tensor (from
+        :py:func:`torch.empty`) of the correct shape, and should fill it.
     """
 
     def __init__(
@@ -79,17 +119,9 @@ class LinearDense(WeightBiasDelayMixin, Connection):
         delay_init: OneToOne[torch.Tensor] | None = None,
     ):
         # connection attributes
-        try:
-            self.in_shape = argtest.ofsequence("in_shape", in_shape, argtest.gt, 0, int)
-        except TypeError:
-            self.in_shape = (argtest.gt("in_shape", in_shape, 0, int),)
-
-        try:
-            self.out_shape = argtest.ofsequence(
-                "out_shape", out_shape, argtest.gt, 0, int
-            )
-        except TypeError:
-            self.out_shape = (argtest.gt("out_shape", out_shape, 0, int),)
+        self.in_shape = _shape_arg("in_shape", in_shape)
+        self.out_shape = _shape_arg("out_shape", out_shape)
+        self._outshape = self.out_shape
 
         # intermediate values
         in_size, out_size = math.prod(self.in_shape), math.prod(self.out_shape)
@@ -108,9 +140,17 @@ class LinearDense(WeightBiasDelayMixin, Connection):
         # call mixin constructor
         WeightBiasDelayMixin.__init__(
             self,
-            weight=torch.rand(out_size, in_size),
-            bias=(None if not bias else torch.rand(out_size)),
-            delay=(None if delay is None else torch.zeros(out_size, in_size)),
+            weight=(torch.empty if weight_init else torch.rand)(out_size, in_size),
+            bias=(
+                None
+                if not bias
+                else (torch.empty if bias_init else torch.rand)(out_size)
+            ),
+            delay=(
+                None
+                if delay is None
+                else (torch.empty if delay_init else torch.zeros)(out_size, in_size)
+            ),
             requires_grad=False,
         )
 
@@ -162,7 +202,7 @@ class LinearDense(WeightBiasDelayMixin, Connection):
             delays = self.delay
         else:
             delays = torch.zeros_like(self.weight)
-        return ein.rearrange(delays, "o i -> 1 i o").expand(self.batchsz, -1, -1)
+        return delays.t().expand(self.batchsz, -1, -1)
 
     def like_bias(self, data: torch.Tensor) -> torch.Tensor:
         r"""Reshapes data like reduced postsynaptic receptive spikes to connection bias.
@@ -241,7 +281,7 @@ class LinearDense(WeightBiasDelayMixin, Connection):
                 * :math:`M_0, \ldots` are the unbatched input dimensions.
                 * :math:`M` is the number of elements across input dimensions.
         """
-        return ein.rearrange(data, "b ... -> b (...)")
+        return data.flatten(1)
 
     def presyn_receptive(self, data: torch.Tensor) -> torch.Tensor:
         r"""Reshapes data like the synapse state for pre-post learning methods.
@@ -341,17 +381,15 @@ class LinearDense(WeightBiasDelayMixin, Connection):
         )  # B I
 
         if self.delayedby:
-            res = self.syncurrent  # B I O
+            res = torch.einsum("bio,oi->bo", self.syncurrent, self.weight)
 
             if self.biased:
-                res = ein.einsum(res, self.weight, "b i o, o i -> b o") + self.bias
-            else:
-                res = ein.einsum(res, self.weight, "b i o, o i -> b o")
+                res = res.add_(self.bias)
 
         else:
             res = F.linear(res, self.weight, self.bias)
 
-        return res.view(-1, *self.outshape)
+        return res.view(-1, *self._outshape)
 
 
 class LinearDirect(WeightBiasDelayMixin, Connection):
@@ -401,6 +439,9 @@ class LinearDirect(WeightBiasDelayMixin, Connection):
 
         If ``delay_init`` is None, ``delay`` is initialized as zeros using
         :py:func:`torch.rand`.
+
+        When an initializer is given, it is passed an uninitialized tensor (from
+        :py:func:`torch.empty`) of the correct shape, and should fill it.
     """
 
     def __init__(
@@ -417,10 +458,8 @@ class LinearDirect(WeightBiasDelayMixin, Connection):
         delay_init: OneToOne[torch.Tensor] | None = None,
     ):
         # connection attribute
-        try:
-            self.shape = argtest.ofsequence("shape", shape, argtest.gt, 0, int)
-        except TypeError:
-            self.shape = (argtest.gt("shape", shape, 0, int),)
+        self.shape = _shape_arg("shape", shape)
+        self._outshape = self.shape
 
         # intermediate value
         size = math.prod(self.shape)
@@ -439,9 +478,15 @@ class LinearDirect(WeightBiasDelayMixin, Connection):
         # call mixin constructor
         WeightBiasDelayMixin.__init__(
             self,
-            weight=torch.rand(size),
-            bias=(None if not bias else torch.rand(size)),
-            delay=(None if delay is None else torch.zeros(size)),
+            weight=(torch.empty if weight_init else torch.rand)(size),
+            bias=(
+                None if not bias else (torch.empty if bias_init else torch.rand)(size)
+            ),
+            delay=(
+                None
+                if delay is None
+                else (torch.empty if delay_init else torch.zeros)(size)
+            ),
             requires_grad=False,
         )
 
@@ -493,7 +538,7 @@ class LinearDirect(WeightBiasDelayMixin, Connection):
         else:
             delays = torch.zeros_like(self.weight)
 
-        return ein.rearrange(delays, "n -> 1 n 1").expand(self.batchsz, -1, -1)
+        return delays.unsqueeze(-1).expand(self.batchsz, -1, -1)
 
     def like_input(self, data: torch.Tensor) -> torch.Tensor:
         r"""Reshapes data like synapse input to connection input.
@@ -572,7 +617,7 @@ class LinearDirect(WeightBiasDelayMixin, Connection):
                 * :math:`N_0, \ldots` are the unbatched input/output dimensions.
                 * :math:`N` is the number of elements across input/output dimensions.
         """
-        return ein.rearrange(data, "b ... -> b (...)")
+        return data.flatten(1)
 
     def presyn_receptive(self, data: torch.Tensor) -> torch.Tensor:
         r"""Reshapes data like the synapse state for pre-post learning methods.
@@ -666,14 +711,14 @@ class LinearDirect(WeightBiasDelayMixin, Connection):
         )  # B N
 
         if self.delayedby:
-            res = ein.rearrange(self.syncurrent, "b n 1 -> b n")
+            res = self.syncurrent.squeeze(-1)
 
         if self.biased:
-            res = res * self.weight + self.bias
+            res = torch.addcmul(self.bias, res, self.weight)
         else:
             res = res * self.weight
 
-        return res.view(-1, *self.outshape)
+        return res.view(-1, *self._outshape)
 
 
 class LinearLateral(WeightBiasDelayMixin, Connection):
@@ -718,10 +763,13 @@ class LinearLateral(WeightBiasDelayMixin, Connection):
         If ``delay_init`` is None, ``delay`` is initialized as zeros using
         :py:func:`torch.rand`.
 
+        When an initializer is given, it is passed an uninitialized tensor (from
+        :py:func:`torch.empty`) of the correct shape, and should fill it.
+
     Note:
         Weights and delays are stored internally like in :py:class:`LinearDense`, but on
-        assignment by :py:attr:`weight` and creation are masked by a tensor
-        :math:`1 - I_N`, where :math:`N = (N_0 \cdot \cdots)`.
+        assignment by :py:attr:`weight` and creation have their diagonal set to zero,
+        equivalent to masking by :math:`1 - I_N`, where :math:`N = (N_0 \cdot \cdots)`.
     """
 
     def __init__(
@@ -738,10 +786,8 @@ class LinearLateral(WeightBiasDelayMixin, Connection):
         delay_init: OneToOne | None = None,
     ):
         # connection attribute
-        try:
-            self.shape = argtest.ofsequence("shape", shape, argtest.gt, 0, int)
-        except TypeError:
-            self.shape = (argtest.gt("shape", shape, 0, int),)
+        self.shape = _shape_arg("shape", shape)
+        self._outshape = self.shape
 
         # intermediate value
         size = math.prod(self.shape)
@@ -757,15 +803,22 @@ class LinearLateral(WeightBiasDelayMixin, Connection):
             ),
         )
 
-        # register buffer
-        self.register_buffer("mask", 1 - torch.eye(size), persistent=False)
-
         # call mixin constructor
         WeightBiasDelayMixin.__init__(
             self,
-            weight=(torch.rand(size, size) * self.mask),
-            bias=(None if not bias else torch.rand(size)),
-            delay=(None if delay is None else torch.zeros(size, size) * self.mask),
+            weight=(
+                torch.empty(size, size)
+                if weight_init
+                else torch.rand(size, size).fill_diagonal_(0)
+            ),
+            bias=(
+                None if not bias else (torch.empty if bias_init else torch.rand)(size)
+            ),
+            delay=(
+                None
+                if delay is None
+                else (torch.empty if delay_init else torch.zeros)(size, size)
+            ),
             requires_grad=False,
         )
 
@@ -790,13 +843,15 @@ class LinearLateral(WeightBiasDelayMixin, Connection):
             torch.Tensor: present weights.
 
         Note:
-            Setter masks weights before assignment.
+            Setter zeroes the diagonal of weights before assignment.
         """
         return WeightBiasDelayMixin.weight.fget(self)
 
     @weight.setter
     def weight(self, value: torch.Tensor) -> None:
-        WeightBiasDelayMixin.weight.fset(self, value * self.mask)
+        WeightBiasDelayMixin.weight.fset(
+            self, _offdiagonal(value, math.prod(self.shape))
+        )
 
     @property
     def delay(self) -> torch.Tensor | None:
@@ -809,13 +864,15 @@ class LinearLateral(WeightBiasDelayMixin, Connection):
             torch.Tensor | None: current delays, if the connection has any.
 
         Note:
-            Setter masks delays before assignment.
+            Setter zeroes the diagonal of delays before assignment.
         """
         return WeightBiasDelayMixin.delay.fget(self)
 
     @delay.setter
     def delay(self, value: torch.Tensor) -> None:
-        WeightBiasDelayMixin.delay.fset(self, value * self.mask)
+        WeightBiasDelayMixin.delay.fset(
+            self, _offdiagonal(value, math.prod(self.shape))
+        )
 
     @property
     def inshape(self) -> tuple[int, ...]:
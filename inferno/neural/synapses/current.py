@@ -1,12 +1,14 @@
-from .mixins import SpikeCurrentMixin, SpikeDerivedCurrentMixin
+from .mixins import SpikeChargeMixin, SpikeCurrentMixin, SpikeDerivedCurrentMixin
 from ..base import InfernoSynapse, SynapseConstructor
-from ..._internal import argtest
 from ...functional import interp_nearest, interp_previous
 import torch
 from typing import Literal
 
 
-class DeltaCurrent(SpikeDerivedCurrentMixin, InfernoSynapse):
+_INTERP_MODES = {"nearest": interp_nearest, "previous": interp_previous}
+
+
+class DeltaCurrent(SpikeChargeMixin, SpikeDerivedCurrentMixin, InfernoSynapse):
     r"""Memoryless synapse which responds instantaneously to input.
 
     .. math::
@@ -61,19 +63,15 @@ class DeltaCurrent(SpikeDerivedCurrentMixin, InfernoSynapse):
         # call superclass constructor
         InfernoSynapse.__init__(self, shape, step_time, delay, batch_size, inplace)
 
-        # synapse attributes
-        self.spike_charge = argtest.neq("spike_charge", spike_charge, 0, float)
+        # call spike charge mixin constructor
+        SpikeChargeMixin.__init__(self, spike_charge)
 
-        match interp_mode.lower():
-            case "nearest":
-                interp = interp_nearest
-            case "previous":
-                interp = interp_previous
-            case _:
-                raise RuntimeError(
-                    f"invalid interp_mode '{interp_mode}' received, must be one of "
-                    "'nearest' or 'previous'."
-                )
+        interp = _INTERP_MODES.get(interp_mode.lower())
+        if interp is None:
+            raise RuntimeError(
+                f"invalid interp_mode '{interp_mode}' received, must be one of "
+                "'nearest' or 'previous'."
+            )
 
         # derivation of currents from spikes
         def spike_to_current(
@@ -82,9 +80,7 @@ class DeltaCurrent(SpikeDerivedCurrentMixin, InfernoSynapse):
             device: torch.device,
             spikes: torch.Tensor,
         ) -> torch.Tensor:
-            return spikes.to(dtype=dtype, device=device) * (
-                synapse.spike_charge / synapse.dt
-            )
+            return spikes.to(dtype=dtype, device=device) * synapse._charge_per_dt
 
         # call mixin constructor
         SpikeDerivedCurrentMixin.__init__(
@@ -158,7 +154,7 @@ class DeltaCurrent(SpikeDerivedCurrentMixin, InfernoSynapse):
         Returns:
             torch.Tensor: synaptic current at the time of the provided input spikes.
         """
-        return spikes * (self.spike_charge / self.dt)
+        return spikes * self._charge_per_dt
 
     def clear(self, **kwargs) -> None:
         r"""Resets synapses to their resting state."""
@@ -180,7 +176,7 @@ class DeltaCurrent(SpikeDerivedCurrentMixin, InfernoSynapse):
         return self.current
 
 
-class DeltaPlusCurrent(SpikeCurrentMixin, InfernoSynapse):
+class DeltaPlusCurrent(SpikeChargeMixin, SpikeCurrentMixin, InfernoSynapse):
     r"""Memoryless synapse which responds instantaneously to input, with passthrough current.
 
     .. math::
@@ -236,19 +232,15 @@ class DeltaPlusCurrent(SpikeCurrentMixin, InfernoSynapse):
         # call superclass constructor
         InfernoSynapse.__init__(self, shape, step_time, delay, batch_size, inplace)
 
-        # synapse attributes
-        self.spike_charge = argtest.neq("spike_charge", spike_charge, 0, float)
+        # call spike charge mixin constructor
+        SpikeChargeMixin.__init__(self, spike_charge)
 
-        match interp_mode.lower():
-            case "nearest":
-                interp = interp_nearest
-            case "previous":
-                interp = interp_previous
-            case _:
-                raise RuntimeError(
-                    f"invalid interp_mode '{interp_mode}' received, must be one of "
-                    "'nearest' or 'previous'."
-                )
+        interp = _INTERP_MODES.get(interp_mode.lower())
+        if interp is None:
+            raise RuntimeError(
+                f"invalid interp_mode '{interp_mode}' received, must be one of "
+                "'nearest' or 'previous'."
+            )
 
         # call mixin constructor
         SpikeCurrentMixin.__init__(
@@ -335,6 +327,16 @@ class DeltaPlusCurrent(SpikeCurrentMixin, InfernoSynapse):
             broadcastable with
             :py:attr:`~inferno.neural.synapses.mixins.CurrentMixin.current`.
         """
-        self.spike = inputs[0].bool()
-        self.current = sum((inputs[0] * (self.spike_charge / self.dt), *inputs[1:]))
+        spikes = inputs[0].bool()
+        self.spike = spikes
+
+        # accumulate injected current in-place on the new spike current
+        ref = self.current_.value
+        current = spikes.to(dtype=ref.dtype, device=ref.device).mul_(
+            self._charge_per_dt
+        )
+        for injected in inputs[1:]:
+            current.add_(injected)
+
+        self.current = current
         return self.current
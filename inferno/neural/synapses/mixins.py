@@ -562,3 +562,57 @@ class SpikeCurrentMixin(CurrentMixin, SpikeMixin):
             spike_overbound,
             tolerance,
         )
+
+
+class SpikeChargeMixin:
+    r"""Mixin for synapses where each spike carries a fixed charge.
+
+    The charge over the simulation step time, used to convert spikes into currents,
+    is cached and recomputed whenever ``spike_charge`` or ``dt`` is set.
+
+    Args:
+        spike_charge (float): charge carried by each presynaptic spike,
+            in :math:`\text{pC}`.
+
+    Important:
+        This must be added before :py:class:`~inferno.neural.InfernoSynapse` in the
+        method resolution order, and its constructor called after that of
+        :py:class:`~inferno.neural.InfernoSynapse`.
+    """
+
+    def __init__(self, spike_charge: float):
+        self.spike_charge = spike_charge
+
+    @property
+    def spike_charge(self) -> float:
+        r"""Charge carried by each presynaptic spike, in picocoulombs.
+
+        Args:
+            value (float): new spike charge.
+
+        Returns:
+            float: present spike charge.
+        """
+        return self._spike_charge
+
+    @spike_charge.setter
+    def spike_charge(self, value: float) -> None:
+        self._spike_charge = argtest.neq("spike_charge", value, 0, float)
+        self._charge_per_dt = self._spike_charge / self.dt
+
+    @property
+    def dt(self) -> float:
+        r"""Length of the simulation time step, in milliseconds.
+
+        Args:
+            value (float): new simulation time step length.
+
+        Returns:
+            float: present simulation time step length.
+        """
+        return InfernoSynapse.dt.fget(self)
+
+    @dt.setter
+    def dt(self, value: float) -> None:
+        InfernoSynapse.dt.fset(self, value)
+        self._charge_per_dt = self._spike_charge / self.dt
@@ -5,7 +5,7 @@ import pytest
 import random
 import torch
 
-from inferno import isi
+from inferno import isi, rescale
 
 
 def allindices(shape: Iterable[int]) -> list[tuple[int, ...]]:
@@ -70,3 +70,80 @@ class TestISI:
         libisi = isi(spikes, 1.0, time_first=time_first)
 
         assert zeroshape == tuple(libisi.shape)
+
+    @pytest.mark.parametrize(
+        "time_first",
+        (True, False),
+        ids=("time_first=True", "time_first=False"),
+    )
+    def test_isi_nosteps(self, time_first):
+        shape = self.random_shape(mindims=2, maxdims=4, minsize=3)
+
+        fullshape = (0, *shape) if time_first else (*shape, 0)
+
+        spikes = torch.zeros(*fullshape).bool()
+        libisi = isi(spikes, 1.0, time_first=time_first)
+
+        assert fullshape == tuple(libisi.shape)
+
+    @pytest.mark.parametrize(
+        "nspikes",
+        (0, 1),
+        ids=("nspikes=0", "nspikes=1"),
+    )
+    @pytest.mark.parametrize(
+        "time_first",
+        (True, False),
+        ids=("time_first=True", "time_first=False"),
+    )
+    def test_isi_nointervals(self, time_first, nspikes):
+        shape = self.random_shape(mindims=2, maxdims=4, minsize=3)
+        steps = random.randint(125, 375)
+
+        spikes = torch.zeros(steps, *shape).bool()
+        if nspikes:
+            times = torch.randint(0, steps, shape)
+            spikes.scatter_(0, times.unsqueeze(0), True)
+
+        if not time_first:
+            spikes = ein.rearrange(spikes, "t ... -> ... t")
+        zeroshape = (0, *shape) if time_first else (*shape, 0)
+
+        libisi = isi(spikes, 1.0, time_first=time_first)
+
+        assert zeroshape == tuple(libisi.shape)
+        assert libisi.is_floating_point()
+
+
+class TestRescale:
+
+    def test_rescale_float64(self):
+        data = torch.rand(37, 11, dtype=torch.float64) * 1000.0
+
+        res = rescale(data, 0.1, 0.7, srcmin=0.0, srcmax=1000.0)
+        ref = 0.1 + (data - 0.0) * ((0.7 - 0.1) / (1000.0 - 0.0))
+
+        assert res.dtype == torch.float64
+        assert torch.all((res - ref).abs() < 1e-12)
+
+    def test_rescale_degenerate(self):
+        data = torch.rand(37, 11)
+
+        res = rescale(data, 0.1, 0.7, srcmin=0.5, srcmax=0.5)
+
+        assert torch.all(torch.isnan(res) | torch.isinf(res))
+
+    def test_rescale_offset(self):
+        data = 1e4 + 10 * torch.rand(37, 11)
+
+        res = rescale(data, 0.0, 1.0)
+
+        assert res.amin() == 0.0
+        assert (res.amax() - 1.0).abs() < 1e-6
+
+        data = -70.0 + 20 * torch.rand(37, 11)
+
+        res = rescale(data, -1.0, 1.0)
+
+        assert res.amin() == -1.0
+        assert (res.amax() - 1.0).abs() < 1e-6
@@ -449,6 +449,27 @@ class TestLinearLateral:
             == conn.bias.shape
         )
 
+    @pytest.mark.parametrize("param", ("weight", "delay"))
+    @pytest.mark.parametrize("kind", ("broadcast", "integer"))
+    def test_masked_setter(self, param, kind):
+        shape = randshape(1, 3, 2, 5)
+        size = math.prod(shape)
+        conn = self.makeconn(shape, 1.0, delay=3.0)
+
+        match kind:
+            case "broadcast":
+                value = torch.rand(size) * 3
+                expected = value.expand(size, size) * self.mask(shape)
+            case "integer":
+                value = torch.randint(1, 4, (size, size))
+                expected = value * self.mask(shape)
+
+        setattr(conn, param, value)
+
+        assert getattr(conn, param).shape == (size, size)
+        assert getattr(conn, param).dtype == torch.get_default_dtype()
+        assert aaeq(getattr(conn, param), expected)
+
     @pytest.mark.parametrize("biased", (True, False), ids=("biased", "unbiased"))
     def test_forward_undelayed(self, biased):
         shape = randshape(1, 3, 2, 5)
@@ -3,7 +3,7 @@ import pytest
 import random
 import torch
 
-from inferno.neural import Synapse, DeltaCurrent, DeltaPlusCurrent
+from inferno.neural import Synapse, DeltaCurrent, DeltaPlusCurrent, LinearDirect
 
 
 def random_shape(mindims=1, maxdims=9, minsize=1, maxsize=9):
@@ -148,6 +148,52 @@ class TestDeltaCurrent:
             synapse.current_at(-selector)[selector != 0] == hyper["current_overbound"]
         )
 
+    @pytest.mark.parametrize(
+        "target",
+        ("synapse_dt", "connection_dt", "spike_charge"),
+    )
+    def test_charge_per_dt_update(self, target):
+        shape = random_shape(maxdims=5)
+        hyper = self.random_hyper()
+        conn = LinearDirect(
+            shape,
+            hyper["step_time"],
+            synapse=DeltaCurrent.partialconstructor(
+                hyper["spike_charge"], hyper["interp_mode"], hyper["interp_tol"]
+            ),
+            batch_size=hyper["batch_size"],
+        )
+        synapse = conn.synapse
+
+        dt, charge = hyper["step_time"], hyper["spike_charge"]
+        match target:
+            case "synapse_dt":
+                dt = random.uniform(0.6, 1.8)
+                synapse.dt = dt
+            case "connection_dt":
+                dt = random.uniform(0.6, 1.8)
+                conn.dt = dt
+            case "spike_charge":
+                charge = random.uniform(20, 30)
+                synapse.spike_charge = charge
+
+        spikes = torch.rand(*synapse.batchedshape) > 0.5
+        res = synapse(spikes)
+
+        assert torch.all((res - spikes * (charge / dt)).abs() <= 5e-6)
+
+    def test_spike_charge_nonzero(self):
+        shape = random_shape()
+        hyper = self.random_hyper()
+
+        with pytest.raises(ValueError):
+            _ = DeltaCurrent(shape, **(hyper | {"spike_charge": 0.0}))
+
+        synapse = DeltaCurrent(shape, **hyper)
+
+        with pytest.raises(ValueError):
+            synapse.spike_charge = 0.0
+
 
 class TestDeltaPlusCurrent:
 
@@ -215,7 +261,12 @@ class TestDeltaPlusCurrent:
         (0, 1, 2),
         ids=("ninjects=0", "ninjects=1", "ninjects=2"),
     )
-    def test_current_integration(self, delayed, inplace, ninjects):
+    @pytest.mark.parametrize(
+        "floating",
+        (True, False),
+        ids=("float64", "bool"),
+    )
+    def test_current_integration(self, delayed, inplace, ninjects, floating):
         shape = random_shape(maxdims=5)
         hyper = self.random_hyper(delayed, inplace)
         synapse = DeltaPlusCurrent(shape, **hyper)
@@ -224,7 +275,18 @@ class TestDeltaPlusCurrent:
             torch.rand(hyper["batch_size"], *shape) for _ in range(ninjects)
         )
 
-        res = synapse(spikes, *injects)
+        if floating:
+            synapse = synapse.double()
+            injects = tuple(inj.double() for inj in injects)
+            res = synapse(
+                spikes * (0.5 + 2.5 * torch.rand(hyper["batch_size"], *shape)),
+                *injects,
+            )
+            assert res.dtype == torch.float64
+            assert synapse.current.dtype == torch.float64
+        else:
+            res = synapse(spikes, *injects)
+
         assert torch.all(
             torch.abs(
                 res
@@ -282,3 +344,49 @@ class TestDeltaPlusCurrent:
         assert torch.all(
             synapse.current_at(-selector)[selector != 0] == hyper["current_overbound"]
         )
+
+    @pytest.mark.parametrize(
+        "target",
+        ("synapse_dt", "connection_dt", "spike_charge"),
+    )
+    def test_charge_per_dt_update(self, target):
+        shape = random_shape(maxdims=5)
+        hyper = self.random_hyper()
+        conn = LinearDirect(
+            shape,
+            hyper["step_time"],
+            synapse=DeltaPlusCurrent.partialconstructor(
+                hyper["spike_charge"], hyper["interp_mode"], hyper["interp_tol"]
+            ),
+            batch_size=hyper["batch_size"],
+        )
+        synapse = conn.synapse
+
+        dt, charge = hyper["step_time"], hyper["spike_charge"]
+        match target:
+            case "synapse_dt":
+                dt = random.uniform(0.6, 1.8)
+                synapse.dt = dt
+            case "connection_dt":
+                dt = random.uniform(0.6, 1.8)
+                conn.dt = dt
+            case "spike_charge":
+                charge = random.uniform(20, 30)
+                synapse.spike_charge = charge
+
+        spikes = torch.rand(*synapse.batchedshape) > 0.5
+        res = synapse(spikes)
+
+        assert torch.all((res - spikes * (charge / dt)).abs() <= 5e-6)
+
+    def test_spike_charge_nonzero(self):
+        shape = random_shape()
+        hyper = self.random_hyper()
+
+        with pytest.raises(ValueError):
+            _ = DeltaPlusCurrent(shape, **(hyper | {"spike_charge": 0.0}))
+
+        synapse = DeltaPlusCurrent(shape, **hyper)
+
+        with pytest.raises(ValueError):
+            synapse.spike_charge = 0.0